@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 
 
@@ -18,15 +16,17 @@ def plot_scatter_grid(dfs: list[pd.DataFrame], cols: tuple[str, str]=('x','y'),
     if len(dfs) != 4:
         raise ValueError("The function requires exactly 4 DataFrames.")
 
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 2, figsize=figsize)
+    x_col, y_col = cols
+    cols_set = frozenset(cols)
 
     for ax, df, title in zip(axes.flat, dfs, [f"Plot {i + 1}" for i in range(4)]):
-        if all(col in df for col in cols):
-            # x = df.loc[:, cols[0]]
-            # y = df.loc[:, cols[1]]
-            sns.scatterplot(data=df, x=cols[0], y=cols[1], ax=ax, alpha=0.7, edgecolor=None)
-            # sns.jointplot(x=x, y=y, ax=ax, alpha=0.7, kind="scatter", color="#4CB391")
-
+        if cols_set.issubset(df.columns):
+            ax.scatter(df[x_col].to_numpy(), df[y_col].to_numpy(), alpha=0.7, edgecolors='none')
+            ax.set_xlabel(x_col)
+            ax.set_ylabel(y_col)
         else:
             ax.set_xticks([])
             ax.set_yticks([])
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def compute_stats(df: pd.DataFrame, col1: str= 'x', col2: str= 'y') -> pd.DataFrame:
@@ -13,10 +14,14 @@ def compute_stats(df: pd.DataFrame, col1: str= 'x', col2: str= 'y') -> pd.DataFr
     Returns:
     - pd.DataFrame with mean, std, and correlation coefficient
     """
-    summary = pd.DataFrame({
-        "Mean": [df[col1].mean(), df[col2].mean()],
-        "Std": [df[col1].std(), df[col2].std()],
-        "Corr": [df[col1].corr(df[col2]), df[col1].corr(df[col2])]  # Corr is repeated for both rows
-    }, index=[col1, col2])
+    a = df[[col1, col2]].to_numpy(dtype=float, na_value=np.nan).T  # shape (2, N)
+    # Skip missing values like pandas: per column for the moments, pairwise for Corr
+    corr = np.corrcoef(a[:, ~np.isnan(a).any(axis=0)])[0, 1]
 
-    return summary.round(1)
+    stats = np.column_stack([
+        np.nanmean(a, axis=1),
+        np.nanstd(a, axis=1, ddof=1),
+        [corr, corr]  # Corr is repeated for both rows
+    ])
+
+    return pd.DataFrame(np.round(stats, 1), index=[col1, col2], columns=["Mean", "Std", "Corr"])